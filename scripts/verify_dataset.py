@@ -20,17 +20,25 @@ def verify_dataset():
         
         # Try to read the dataset
         print(f"Reading dataset from {dataset_path}...")
-        df = pd.read_csv(dataset_path)
-        
+        # Only the header and the Class column are needed; the V features are
+        # tokenized by the parser but never materialized
+        columns = pd.read_csv(dataset_path, nrows=0).columns
+        classes = pd.read_csv(dataset_path, usecols=['Class'],
+                              dtype={'Class': 'int8'}, engine='c')['Class']
+        n_rows, n_cols = len(classes), len(columns)
+        if n_rows == 0:
+            print("Error: Dataset contains no rows")
+            return False
+
         # Print dataset information
         print("\nDataset Summary:")
-        print(f"Shape: {df.shape[0]} rows, {df.shape[1]} columns")
-        print(f"Columns: {', '.join(df.columns)}")
+        print(f"Shape: {n_rows} rows, {n_cols} columns")
+        print(f"Columns: {', '.join(columns)}")
         
         # Check for fraud distribution
-        fraud_count = df['Class'].sum()
-        legitimate_count = df.shape[0] - fraud_count
-        fraud_percentage = (fraud_count / df.shape[0]) * 100
+        fraud_count = classes.sum()
+        legitimate_count = n_rows - fraud_count
+        fraud_percentage = (fraud_count / n_rows) * 100
         
         print("\nClass Distribution:")
         print(f"Legitimate Transactions: {legitimate_count} ({100 - fraud_percentage:.2f}%)")
@@ -43,7 +51,7 @@ def verify_dataset():
             
         with open(os.path.join(log_dir, 'dataset_verification.log'), 'w') as f:
             f.write(f"Dataset verification completed at {datetime.now()}\n")
-            f.write(f"Dataset shape: {df.shape[0]} rows, {df.shape[1]} columns\n")
+            f.write(f"Dataset shape: {n_rows} rows, {n_cols} columns\n")
             f.write(f"Legitimate Transactions: {legitimate_count} ({100 - fraud_percentage:.2f}%)\n")
             f.write(f"Fraudulent Transactions: {fraud_count} ({fraud_percentage:.2f}%)\n")
         